@@ -10,26 +10,94 @@ from typing import TYPE_CHECKING
 import asyncio
 import logging
 import os
+import socket
 import time
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 if TYPE_CHECKING:
+    from hikariwave.audio.store import FrameStore
     from hikariwave.connection import VoiceConnection
 
 logger: logging.Logger = logging.getLogger("hikari-wave.ffmpeg")
 
 __all__ = ("FFmpegPool", "FFmpegWorker",)
 
+# Seconds a worker can sit idle before it's reaped, while the pool is above its minimum
+_IDLE_TIMEOUT: float = 60.0
+
+# Only Linux can resize pipes
+_F_SETPIPE_SZ: int | None = getattr(fcntl, "F_SETPIPE_SZ", None)
+
+def _resize_pipe(fd: int) -> None:
+    if _F_SETPIPE_SZ is None:
+        return
+
+    try:
+        fcntl.fcntl(fd, _F_SETPIPE_SZ, Audio.PIPE_SIZE)
+    except OSError:
+        pass
+
 class FFmpegWorker:
     """Manages a single FFmpeg process when requested."""
 
-    __slots__ = ("_process",)
+    __slots__ = ("_pool", "_process", "_socket", "_stdout", "_buffer", "_view", "_idle_since",)
 
-    def __init__(self) -> None:
+    def __init__(self, pool: FFmpegPool) -> None:
         """
         Create a new worker.
+
+        Parameters
+        ----------
+        pool : FFmpegPool
+            The pool that owns this worker.
         """
 
+        self._pool: FFmpegPool = pool
         self._process: asyncio.subprocess.Process = None
+        self._socket: socket.socket | None = None
+        self._stdout: asyncio.StreamReader | None = None
+        self._buffer: bytearray = bytearray(Audio.READ_SIZE)
+        self._view: memoryview = memoryview(self._buffer)
+        self._idle_since: float = time.monotonic()
+
+    async def _feed(self, stdin: asyncio.StreamWriter, content: bytearray | bytes | memoryview) -> None:
+        try:
+            # Not every event loop exposes the underlying pipe (uvloop doesn't)
+            pipe: object | None = stdin.get_extra_info("pipe")
+            if pipe is not None:
+                _resize_pipe(pipe.fileno())
+            
+            stdin.transport.set_write_buffer_limits(high=Audio.BLOCKSIZE)
+
+            view: memoryview = memoryview(content).cast("B")
+
+            for offset in range(0, len(view), Audio.BLOCKSIZE):
+                if stdin.is_closing():
+                    return
+
+                stdin.write(view[offset:offset + Audio.BLOCKSIZE])
+                await stdin.drain()
+            
+            stdin.close()
+            await stdin.wait_closed()
+        except ConnectionError:
+            pass
+        except Exception as e:
+            logger.error(f"FFmpeg encode error: {e}")
+            stdin.close()
+
+    async def _read_into(self, view: memoryview) -> int:
+        if self._socket is not None:
+            return await asyncio.get_running_loop().sock_recv_into(self._socket, view)
+        
+        data: bytes = await self._stdout.read(len(view))
+        view[:len(data)] = data
+
+        return len(data)
 
     async def encode(self, source: AudioSource, connection: VoiceConnection) -> None:
         """
@@ -58,70 +126,155 @@ class FFmpegWorker:
         channels: int = source._channels or connection._config.channels
         volume: float | str = source._volume or connection._config.volume
 
-        args: list[str] = [
-            "ffmpeg",
-            "-blocksize", str(Audio.BLOCKSIZE),
+        args: tuple[str, ...] = self._pool._args_head + (
             "-i", "pipe:0" if pipeable else content,
-            "-map", "0:a",
             "-af", f"volume={volume}",
-            "-acodec", "libopus",
-            "-f", "opus",
-            "-ar", str(Audio.SAMPLING_RATE),
             "-ac", str(channels),
             "-b:a", bitrate,
-            "-application", "audio",
-            "-frame_duration", str(Audio.FRAME_LENGTH),
-            "-loglevel", "warning",
-            "pipe:1",
-        ]
-
-        self._process = await asyncio.create_subprocess_exec(
-            *args,
-            stdin=asyncio.subprocess.PIPE if pipeable else None,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.DEVNULL,
-        )
+        ) + Audio.FFMPEG_OUTPUT_ARGS
+
+        # Windows can't hand a socket to a child process as its stdout
+        if os.name == "nt":
+            stdout: int | socket.socket = asyncio.subprocess.PIPE
+        else:
+            self._socket, stdout = socket.socketpair()
+            self._socket.setblocking(False)
 
-        if pipeable:
             try:
-                self._process.stdin.write(content)
-                await self._process.stdin.drain()
-                self._process.stdin.close()
-                await self._process.stdin.wait_closed()
-            except Exception as e:
-                logger.error(f"FFmpeg encode error: {e}")
+                self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, Audio.PIPE_SIZE)
+                stdout.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, Audio.PIPE_SIZE)
+            except OSError:
+                pass
+
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.PIPE if pipeable else None,
+                stdout=stdout,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+        except BaseException:
+            if self._socket:
+                self._socket.close()
+                self._socket = None
+            
+            raise
+        finally:
+            if isinstance(stdout, socket.socket):
+                stdout.close()
+        
+        self._stdout = self._process.stdout
+
+        feeder: asyncio.Task[None] | None = None
+
+        if pipeable:
+            feeder = asyncio.create_task(self._feed(self._process.stdin, content))
         
+        store: FrameStore = connection.player._store
+        epoch: int = store._epoch
+
+        buffer: bytearray = self._buffer
+        view: memoryview = self._view
+        end: int = 0
+        parts: list[bytes] = []
+        frames: int = 0
+
         start: float = time.perf_counter()
-        while True:
-            try:
-                header: bytes = await self._process.stdout.readexactly(27)
-                if not header.startswith(b"OggS"):
-                    return None
-                
-                segments_count: int = header[26]
-                segment_table: bytes = await self._process.stdout.readexactly(segments_count)
+        try:
+            while received := await self._read_into(view[end:]):
+                end += received
+                offset: int = 0
+
+                while end - offset >= 27:
+                    if store._epoch != epoch:
+                        await self.stop()
+
+                        end = offset = 0
+                        break
+
+                    if buffer[offset:offset + 4] != b"OggS":
+                        logger.error("FFmpeg produced an invalid Ogg page")
+                        await self.stop()
+
+                        # Stopping drops the exit code, so a source that never produced audio is failed here
+                        if not frames:
+                            store._failed = True
+
+                        end = offset = 0
+                        break
+
+                    table_start: int = offset + 27
+                    table_end: int = table_start + buffer[offset + 26]
+                    if end < table_end:
+                        break
+
+                    segment_table: bytes = bytes(view[table_start:table_end])
+                    page_end: int = table_end + sum(segment_table)
+                    if end < page_end:
+                        break
+
+                    packet_start: int = table_end
+                    cursor: int = table_end
+                    for lacing_value in segment_table:
+                        cursor += lacing_value
 
-                current_packet: bytearray = bytearray()
-                for lacing_value in segment_table:
-                    data: bytes = await self._process.stdout.readexactly(lacing_value)
-                    current_packet.extend(data)
+                        if lacing_value == 255:
+                            continue
 
-                    if lacing_value < 255:
-                        packet_bytes: bytes = bytes(current_packet)
+                        packet: bytes = bytes(view[packet_start:cursor])
+                        packet_start = cursor
+
+                        if parts:
+                            parts.append(packet)
+                            packet = b"".join(parts)
+                            parts.clear()
 
                         if not (
-                            packet_bytes.startswith(b"OpusHead") or
-                            packet_bytes.startswith(b"OpusTags")
+                            packet.startswith(b"OpusHead") or
+                            packet.startswith(b"OpusTags") or
+                            store._epoch != epoch
                         ):
-                            await connection.player._store.store_frame(packet_bytes)
-                        
-                        current_packet.clear()
-            except asyncio.IncompleteReadError:
-                break
+                            await store.store_frame(packet)
+                            frames += 1
+                    
+                    if packet_start < cursor:
+                        parts.append(bytes(view[packet_start:cursor]))
+                
+                    offset = page_end
+            
+                if offset:
+                    buffer[:end - offset] = buffer[offset:end]
+                    end -= offset
+        finally:
+            if feeder and not feeder.done():
+                feeder.cancel()
+
+                try:
+                    await feeder
+                except asyncio.CancelledError:
+                    pass
+
+            if self._socket:
+                self._socket.close()
+                self._socket = None
+            
+            self._stdout = None
         
         logger.debug(f"FFmpeg finished in {(time.perf_counter() - start) * 1000:.2f}ms")
 
-        await connection.player._store.store_frame(None)
+        if self._process and store._epoch == epoch:
+            try:
+                returncode: int = await asyncio.wait_for(self._process.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                returncode: int = 0
+            
+            if returncode and not frames:
+                logger.error(f"FFmpeg exited with code {returncode} without producing audio for {source!r}")
+                store._failed = True
+
+        if store._epoch == epoch:
+            await store.store_frame(None)
+        
         await self.stop()
     
     async def stop(self) -> None:
@@ -132,32 +285,40 @@ class FFmpegWorker:
         if not self._process:
             return
         
-        for stream in (self._process.stdin, self._process.stdout, self._process.stderr):
-            if stream and hasattr(stream, "_transport"):
-                try:
-                    stream._transport.close()
-                except:
-                    pass
+        process: asyncio.subprocess.Process = self._process
+        self._process = None
+
+        if process.stdin and not process.stdin.is_closing():
+            process.stdin.close()
         
-        if self._process.returncode is None:
-            try:
-                self._process.kill()
-                await self._process.wait()
-            except ProcessLookupError:
-                pass
+        if process.returncode is not None:
+            return
+        
+        try:
+            process.terminate()
 
-        self._process = None
+            try:
+                await asyncio.wait_for(process.wait(), timeout=2.0)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+        except ProcessLookupError:
+            pass
 
 class FFmpegPool:
     """Manages all FFmpeg processes and deploys them when needed."""
 
     __slots__ = (
         "_enabled", 
-        "_max", "_total", "_min",
-        "_available", "_unavailable",
+        "_max", "_total", "_min", "_threads",
+        "_available", "_unavailable", "_args_head",
     )
 
-    def __init__(self, max_per_core: int = 2, max_global: int = 16) -> None:
+    def __init__(
+        self,
+        max_per_core: int = 2,
+        max_global: int = 16,
+    ) -> None:
         """
         Create a FFmpeg process pool.
         
@@ -167,16 +328,43 @@ class FFmpegPool:
             The maximum amount of processes that can be spawned per logical CPU core.
         max_global : int
             The maximum, hard-cap amount of processes that can be spawned.
-        """
         
+        Note
+        ----
+        Each process may use logical CPU cores split evenly between the maximum amount of processes.
+        """
+
+        cpu_count: int = os.cpu_count() or 1
+
         self._enabled: bool = True
 
-        self._max: int = min(max_global, os.cpu_count() * max_per_core)
+        self._max: int = min(max_global, cpu_count * max_per_core)
         self._total: int = 0
         self._min: int = 0
+        self._threads: int = max(1, cpu_count // max(1, self._max))
 
         self._available: asyncio.Queue[FFmpegWorker] = asyncio.Queue()
         self._unavailable: set[FFmpegWorker] = set()
+
+        self._args_head: tuple[str, ...] = (
+            "ffmpeg",
+            "-threads", str(self._threads),
+            "-blocksize", str(Audio.BLOCKSIZE),
+        )
+    
+    def _acquire_idle(self) -> FFmpegWorker | None:
+        now: float = time.monotonic()
+
+        while not self._available.empty():
+            worker: FFmpegWorker = self._available.get_nowait()
+
+            if self._total > self._min and now - worker._idle_since >= _IDLE_TIMEOUT:
+                self._total -= 1
+                continue
+
+            return worker
+        
+        return None
     
     async def submit(self, source: AudioSource, connection: VoiceConnection) -> None:
         """
@@ -192,11 +380,13 @@ class FFmpegPool:
         
         if not self._enabled: return
 
-        if self._available.empty() and self._total < self._max:
-            worker: FFmpegWorker = FFmpegWorker()
+        worker: FFmpegWorker | None = self._acquire_idle()
+
+        if worker is None and self._total < self._max:
+            worker = FFmpegWorker(self)
             self._total += 1
-        else:
-            worker: FFmpegWorker = await self._available.get()
+        elif worker is None:
+            worker = await self._available.get()
 
         self._unavailable.add(worker)
 
@@ -204,12 +394,10 @@ class FFmpegPool:
             try:
                 await worker.encode(source, connection)
             finally:
-                self._unavailable.remove(worker)
+                self._unavailable.discard(worker)
 
-                if self._total > self._min:
-                    self._total -= 1
-                else:
-                    await self._available.put(worker)
+                worker._idle_since = time.monotonic()
+                self._available.put_nowait(worker)
 
         asyncio.create_task(_run())
     
@@ -5,8 +5,9 @@ from hikariwave.audio.source import AudioSource
 from hikariwave.audio.store import FrameStore
 from hikariwave.event.types import WaveEventType
 from hikariwave.internal.constants import Audio
+from hikariwave.internal.encrypt import Cipher
 from hikariwave.internal.result import Result, ResultReason
-from typing import Any, Callable, Coroutine, TYPE_CHECKING
+from typing import Awaitable, Callable, TYPE_CHECKING
 
 import asyncio
 import logging
@@ -21,6 +22,10 @@ __all__ = ("AudioPlayer",)
 
 logger: logging.Logger = logging.getLogger("hikariwave.player")
 
+_RTP_HEADER: struct.Struct = struct.Struct(">BBHII")
+_MAX_CATCH_UP: int = 3
+_SILENCE: bytes = b"\xF8\xFF\xFE"
+
 class AudioPlayer:
     """Responsible for all audio."""
 
@@ -64,15 +69,14 @@ class AudioPlayer:
         self._track_completed: bool = False
         self._volume: float | str | None = None
 
-    def _generate_rtp(self) -> bytes:
-        header: bytearray = bytearray(12)
-        header[0] = 0x80
-        header[1] = 0x78
-        struct.pack_into(">H", header, 2, self._sequence)
-        struct.pack_into(">I", header, 4, self._timestamp)
-        struct.pack_into(">I", header, 8, self._connection._ssrc)
+    def _encrypt(self, header: bytes, audio: bytes) -> bytes:
+        encrypted: bytes = self._connection._mode(self._connection._cipher, self._nonce, header, audio)
+        self._nonce = (self._nonce + 1) & Audio.BIT_32U
+
+        return encrypted
 
-        return bytes(header)
+    def _generate_rtp(self) -> bytes:
+        return _RTP_HEADER.pack(0x80, 0x78, self._sequence, self._timestamp, self._connection._ssrc)
 
     async def _play_internal(self, source: AudioSource) -> bool:
         self._ended.clear()
@@ -93,9 +97,18 @@ class AudioPlayer:
         
         await self._store.wait()
 
-        frame_duration: float = Audio.FRAME_LENGTH / 1000
+        frame_ns: int = Audio.FRAME_LENGTH_NS
+        samples_per_frame: int = Audio.SAMPLES_PER_FRAME
         frame_count: int = 0
-        start_time: float = time.perf_counter()
+        start_ns: int = time.monotonic_ns()
+
+        fetch_frame: Callable[[], Awaitable[bytes | None]] = self._store.fetch_frame
+        opus: bytes | None = await fetch_frame()
+
+        generation: int = self._connection._session_generation
+        encrypt: Callable[[Cipher, int, bytes, bytes], bytes] = self._connection._mode
+        cipher: Cipher = self._connection._cipher
+        send: Callable[[bytes], Awaitable[None]] = self._connection._server.send
 
         while not self._ended.is_set() and not self._skip.is_set():
             if not self._resumed.is_set():
@@ -103,29 +116,37 @@ class AudioPlayer:
                 await self._resumed.wait()
 
                 frame_count = 0
-                start_time = time.perf_counter()
+                start_ns = time.monotonic_ns()
                 continue
 
-            opus: bytes = await self._store.fetch_frame()
             if opus is None:
-                self._track_completed = True
+                self._track_completed = not self._store._failed
                 break
 
+            # A reconnect can swap the server and session key while we're waiting on a frame
+            if self._connection._session_generation != generation:
+                generation = self._connection._session_generation
+                encrypt = self._connection._mode
+                cipher = self._connection._cipher
+                send = self._connection._server.send
+
             header: bytes = self._generate_rtp()
-            encrypted: bytes = self._connection._mode(self._connection._secret, self._nonce, header, opus)
-            await self._connection._server.send(encrypted)
+            await send(encrypt(cipher, self._nonce, header, opus))
 
-            self._sequence = (self._sequence + 1) % Audio.BIT_16U
-            self._timestamp = (self._timestamp + Audio.SAMPLES_PER_FRAME) % Audio.BIT_32U
+            self._nonce = (self._nonce + 1) & Audio.BIT_32U
+            self._sequence = (self._sequence + 1) & Audio.BIT_16U
+            self._timestamp = (self._timestamp + samples_per_frame) & Audio.BIT_32U
             frame_count += 1
 
-            target: float = start_time + (frame_count * frame_duration)
-            sleep: float = target - time.perf_counter()
+            opus = await fetch_frame()
+
+            lag_ns: int = time.monotonic_ns() - (start_ns + frame_count * frame_ns)
 
-            if sleep > 0:
-                await asyncio.sleep(sleep)
-            elif sleep < -0.020:
-                logger.debug(f"Frame {frame_count} is {-sleep:.3f}s behind schedule")
+            if lag_ns < 0:
+                await asyncio.sleep(-lag_ns / 1_000_000_000)
+            elif lag_ns > _MAX_CATCH_UP * frame_ns:
+                logger.debug(f"Frame {frame_count} is {lag_ns / 1_000_000:.1f}ms behind schedule, resynchronizing")
+                start_ns += lag_ns
         
         if self._skip.is_set() and not self._ended.is_set():
             self._track_completed = False
@@ -170,9 +191,21 @@ class AudioPlayer:
                     self._history.append(source)
 
     async def _send_silence(self) -> None:
-        send: Callable[[bytes], Coroutine[Any, Any, None]] = self._connection._server.send
+        sequence: int = self._sequence
+        timestamp: int = self._timestamp
+        packets: list[bytes] = []
+
         for _ in range(5):
-            await send(b"\xF8\xFF\xFE")
+            header: bytes = _RTP_HEADER.pack(0x80, 0x78, sequence, timestamp, self._connection._ssrc)
+            packets.append(self._encrypt(header, _SILENCE))
+
+            sequence = (sequence + 1) & Audio.BIT_16U
+            timestamp = (timestamp + Audio.SAMPLES_PER_FRAME) & Audio.BIT_32U
+
+        self._sequence = sequence
+        self._timestamp = timestamp
+
+        await self._connection._server.send_batch(packets)
 
     async def add_queue(self, source: AudioSource) -> Result:
         """
@@ -6,6 +6,7 @@ from hikariwave.config import (
     validate_volume,
 )
 
+import asyncio
 import os
 
 __all__ = (
@@ -50,11 +51,51 @@ def _validate_name(name: object) -> str:
 class AudioSource:
     """Base audio source implementation."""
 
+    __slots__ = ()
+
+    _hash: int | None = None
+    """Cached hash, set by subclasses that can compute it once - Otherwise, hashed from the content."""
+    _repr_exclude: tuple[str, ...] = ("_hash", "__dict__", "__weakref__",)
+    """Slots left out of the repr - Subclasses may list more, which are added to their parents'."""
+    _repr_fields: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+
+        excluded: set[str] = set()
+        fields: list[str] = []
+
+        # Only read each class's own attributes, so inherited slots aren't listed twice
+        for klass in reversed(cls.__mro__):
+            excluded.update(klass.__dict__.get("_repr_exclude", ()))
+
+            slots: str | tuple[str, ...] = klass.__dict__.get("__slots__", ())
+            fields.extend((slots,) if isinstance(slots, str) else slots)
+
+        cls._repr_fields = tuple(field for field in fields if field not in excluded)
+
+    def __repr__(self) -> str:
+        fields: list[str] = []
+
+        for field in self._repr_fields:
+            value: object = getattr(self, field, None)
+
+            if isinstance(value, (bytearray, bytes, memoryview)):
+                fields.append(f"{field[1:]}=<{len(value)} bytes>")
+            else:
+                fields.append(f"{field[1:]}={value!r}")
+
+        return f"{type(self).__name__}({', '.join(fields)})"
+
     def __eq__(self, other: object) -> bool:
         if type(self) is not type(other): return False
+        if self._hash is not None and self._hash != other._hash: return False
         return self._content == other._content
     
     def __hash__(self) -> int:
+        if self._hash is not None:
+            return self._hash
+        
         return hash((type(self), self._content))
 
     @property
@@ -86,6 +127,7 @@ class BufferAudioSource(AudioSource):
         "_channels",
         "_name",
         "_volume",
+        "_hash",
     )
 
     def __init__(
@@ -139,6 +181,8 @@ class BufferAudioSource(AudioSource):
         self._channels: int | None = validate_channels(channels) if channels is not None else None
         self._name: str | None = _validate_name(name) if name is not None else None
         self._volume: float | str | None = validate_volume(volume) if volume is not None else None
+
+        self._hash: int = hash((BufferAudioSource, len(self._content)))
     
     @property
     def buffer(self) -> bytearray | bytes | memoryview:
@@ -154,6 +198,7 @@ class FileAudioSource(AudioSource):
         "_channels",
         "_name",
         "_volume",
+        "_hash",
     )
 
     def __init__(
@@ -190,11 +235,15 @@ class FileAudioSource(AudioSource):
             - If `name` is provided and not `str`.
             - If `volume` is provided and not `float` or `str`.
         ValueError
-            - If `filepath` is empty or is not found as a file on the system.
+            - If `filepath` is empty.
             - If `bitrate` is provided, and is not between `6k` and `510k`.
             - If `channels` is provided and not `1` or `2`.
             - If `name` is provided and is empty.
             - If `volume` is provided and is either a `float` and is not positive or a `str` and does not end with `dB`, contain a number, or (if provided) doesn't begin with `-` or `+`.
+        
+        Note
+        ----
+        The file's existence isn't checked here to avoid blocking the event loop - Use `FileAudioSource.create` to check it.
         """
 
         self._content: str = _validate_content(filepath, "filepath", (str,))
@@ -204,10 +253,65 @@ class FileAudioSource(AudioSource):
         self._name: str | None = _validate_name(name) if name is not None else None
         self._volume: float | str | None = validate_volume(volume) if volume is not None else None
 
-        if not os.path.isfile(self._content):
-            error: str = f"No file exists at this path: {self._content}"
-            raise FileNotFoundError(error)
+        self._hash: int = hash((FileAudioSource, self._content))
     
+    @classmethod
+    async def create(
+        cls,
+        filepath: str,
+        *,
+        bitrate: str | None = None,
+        channels: int | None = None,
+        name: str | None = None,
+        volume: float | str | None = None
+    ) -> FileAudioSource:
+        """
+        Create a file audio source, checking that the file exists without blocking the event loop.
+        
+        Parameters
+        ----------
+        filepath : str
+            The filepath to the audio file.
+        bitrate : str | None
+            If provided, the bitrate in which to play this source back at.
+        channels : int | None
+            If provided, the amount of channels this source plays with.
+        name : str | None
+            If provided, an internal name used for display purposes.
+        volume : float | str | None
+            If provided, overrides the player's set/default volume. Can be scaled (`0.5`, `1.0`, `2.0`, etc.) or dB-based (`-3dB`, etc.).
+        
+        Returns
+        -------
+        FileAudioSource
+            The created file audio source.
+        
+        Raises
+        ------
+        FileNotFoundError
+            If `filepath` is not found as a file on the system.
+        TypeError
+            - If `filepath` is not `str`.
+            - If `bitrate` is provided and not `str`.
+            - If `channels` is provided and not `int`.
+            - If `name` is provided and not `str`.
+            - If `volume` is provided and not `float` or `str`.
+        ValueError
+            - If `filepath` is empty.
+            - If `bitrate` is provided, and is not between `6k` and `510k`.
+            - If `channels` is provided and not `1` or `2`.
+            - If `name` is provided and is empty.
+            - If `volume` is provided and is either a `float` and is not positive or a `str` and does not end with `dB`, contain a number, or (if provided) doesn't begin with `-` or `+`.
+        """
+
+        source: FileAudioSource = cls(filepath, bitrate=bitrate, channels=channels, name=name, volume=volume)
+
+        if not await asyncio.to_thread(os.path.isfile, source._content):
+            error: str = f"No file exists at this path: {source._content}"
+            raise FileNotFoundError(error)
+        
+        return source
+
     @property
     def filepath(self) -> str:
         """The filepath to the audio file"""
@@ -222,6 +326,7 @@ class URLAudioSource(AudioSource):
         "_channels",
         "_name",
         "_volume",
+        "_hash",
     )
 
     def __init__(
@@ -272,6 +377,8 @@ class URLAudioSource(AudioSource):
         self._name: str | None = _validate_name(name) if name is not None else None
         self._volume: float | str | None = validate_volume(volume) if volume is not None else None
 
+        self._hash: int = hash((URLAudioSource, self._content))
+
     @property
     def url(self) -> str:
         """The URL to the audio source."""
@@ -3,25 +3,54 @@ from __future__ import annotations
 from collections import deque
 from hikariwave.config import BufferMode
 from hikariwave.internal.constants import Audio
-from typing import TYPE_CHECKING
+from typing import Callable, TYPE_CHECKING
 
-import aiofiles
 import asyncio
+import logging
 import os
+import struct
 
 if TYPE_CHECKING:
     from hikariwave.connection import VoiceConnection
 
+logger: logging.Logger = logging.getLogger("hikari-wave.store")
+
 __all__ = ("FrameStore",)
 
+_LENGTH_PREFIX: struct.Struct = struct.Struct(">H")
+
+# The cache is read once and deleted, so there's no point updating its access time
+_READ_FLAGS: int = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NOATIME", 0)
+
+def _read_file(path: str, offset: int, length: int) -> bytes:
+    try:
+        fd: int = os.open(path, _READ_FLAGS)
+    except PermissionError:
+        fd: int = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+
+    with open(fd, "rb") as file:
+        file.seek(offset)
+        return file.read(length)
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _write_file(path: str, offset: int, chunk: bytearray) -> None:
+    with open(path, "ab" if offset else "wb") as file:
+        file.write(chunk)
+
 class FrameStore:
     """Mode-switching capable storage buffer."""
 
     __slots__ = (
         "_connection", "_live_buffer", "_frames_per_second", "_memory_limit",
         "_read_lock", "_chunk_lock", "_chunk_buffer", "_chunk_frame_limit", "_chunk_frame_count",
-        "_disk_queue", "_current_file", "_current_file_path", "_file_index",
-        "_low_mark", "_high_mark", "_refilling", "_eos_written", "_eos_emitted", "_event", "_read_task",
+        "_disk_queue", "_write_offset",
+        "_low_mark", "_high_mark", "_refilling", "_eos_written", "_eos_emitted", "_failed", "_event", "_waiting", "_low_water", "_refill_task",
+        "_capacity", "_not_full", "_epoch",
     )
 
     def __init__(self, connection: VoiceConnection) -> None:
@@ -36,7 +65,7 @@ class FrameStore:
 
         self._connection: VoiceConnection = connection
 
-        self._live_buffer: asyncio.Queue[bytes | None] = asyncio.Queue()
+        self._live_buffer: deque[bytes | None] = deque()
 
         self._frames_per_second: int = 1000 // Audio.FRAME_LENGTH
         self._memory_limit: int = (
@@ -50,10 +79,8 @@ class FrameStore:
         self._chunk_frame_limit: int = self._memory_limit
         self._chunk_frame_count: int = 0
 
-        self._disk_queue: deque[int] = deque()
-        self._current_file: aiofiles.threadpool.binary.AsyncBufferedReader | None = None
-        self._current_file_path: str | None = None
-        self._file_index: int = 0
+        self._disk_queue: deque[tuple[int, int]] = deque()
+        self._write_offset: int = 0
 
         self._low_mark: int = self._memory_limit // 4
         self._high_mark: int = self._memory_limit
@@ -61,65 +88,115 @@ class FrameStore:
 
         self._eos_written: bool = False
         self._eos_emitted: bool = False
+        self._failed: bool = False
 
         self._event: asyncio.Event = asyncio.Event()
-        self._read_task: asyncio.Task[None] | None = None
+        self._waiting: bool = False
+        self._low_water: asyncio.Event = asyncio.Event()
+        self._refill_task: asyncio.Task[None] | None = None
+
+        self._capacity: int = (
+            self._connection._config.buffer.duration * self._frames_per_second
+            if self._connection._config.buffer.mode == BufferMode.MEMORY and self._connection._config.buffer.duration else 0
+        )
+        self._not_full: asyncio.Event = asyncio.Event()
+        self._not_full.set()
+        self._epoch: int = 0
 
         if self._connection._config.buffer.mode == BufferMode.DISK:
             os.makedirs(f"wavecache/{self._connection._guild_id}", exist_ok=True)
     
+    def _cache_path(self) -> str:
+        return f"wavecache/{self._connection._guild_id}/{self._epoch}.wcf"
+
     async def _flush_chunk(self) -> None:
         if not self._chunk_buffer:
             return
 
-        self._file_index += 1
+        epoch: int = self._epoch
+        path: str = self._cache_path()
 
-        async with aiofiles.open(f"wavecache/{self._connection._guild_id}/{self._file_index}.wcf", "wb") as file:
-            await file.write(self._chunk_buffer)
-        
-        self._disk_queue.append(self._file_index)
-        self._chunk_buffer.clear()
+        chunk: bytearray = self._chunk_buffer
+        self._chunk_buffer = bytearray()
         self._chunk_frame_count = 0
 
+        await asyncio.to_thread(_write_file, path, self._write_offset, chunk)
+
+        if self._epoch != epoch:
+            await asyncio.to_thread(_remove_file, path)
+            return
+        
+        self._disk_queue.append((self._write_offset, len(chunk)))
+        self._write_offset += len(chunk)
+
+        self._start_refill()
+
+        if len(self._live_buffer) <= self._low_mark:
+            self._low_water.set()
+
     async def _read_chunk(self) -> None:
-        try:
-            async with self._read_lock:
-                if self._refilling or not self._disk_queue:
-                    return
-            
-                self._refilling = True
-                file_index: int = self._disk_queue.popleft()
+        async with self._read_lock:
+            if self._refilling or not self._disk_queue:
+                return
+        
+            self._refilling = True
+            chunk_offset, chunk_length = self._disk_queue.popleft()
 
-                try:
-                    path: str = f"wavecache/{self._connection._guild_id}/{file_index}.wcf"
-
-                    async with aiofiles.open(path, "rb") as file:
-                        batch: list[bytes] = []
-                        
-                        while True:
-                            length_bytes: bytes = await file.read(2)
-                            if not length_bytes:
-                                break
-
-                            batch.append(await file.read(int.from_bytes(length_bytes, "big")))
-                    
-                            if len(batch) >= 100:
-                                for frame in batch: await self._live_buffer.put(frame)
-
-                                batch.clear()
-                                await asyncio.sleep(0)
-                        
-                        for frame in batch: await self._live_buffer.put(frame)
-
-                    os.remove(path)
-
-                    if not self._disk_queue and self._eos_written:
-                        await self._live_buffer.put(None)
-                finally:
-                    self._refilling = False
+            try:
+                path: str = self._cache_path()
+
+                data: bytes = await asyncio.to_thread(_read_file, path, chunk_offset, chunk_length)
+                unpack_length: Callable[[bytes, int], tuple[int]] = _LENGTH_PREFIX.unpack_from
+                offset: int = 0
+                count: int = 0
+
+                while offset < len(data):
+                    length: int = unpack_length(data, offset)[0]
+                    offset += 2
+
+                    self._live_buffer.append(data[offset:offset + length])
+                    offset += length
+                    count += 1
+
+                    if count % 100 == 0:
+                        if self._waiting:
+                            self._event.set()
+
+                        await asyncio.sleep(0)
+
+                if not self._disk_queue and self._eos_written:
+                    self._live_buffer.append(None)
+                
+                if not self._disk_queue:
+                    if self._waiting:
+                        self._event.set()
+
+                    # Everything written so far has been read back, so start the cache over
+                    async with self._chunk_lock:
+                        if not self._disk_queue and self._write_offset:
+                            self._write_offset = 0
+                            await asyncio.to_thread(_remove_file, path)
+            finally:
+                self._refilling = False
+
+                if self._waiting:
                     self._event.set()
-        except asyncio.CancelledError:
-            return
+
+    async def _refill_loop(self) -> None:
+        while True:
+            await self._low_water.wait()
+            self._low_water.clear()
+
+            while self._disk_queue and len(self._live_buffer) <= self._low_mark:
+                try:
+                    await self._read_chunk()
+                except OSError as e:
+                    logger.error(f"Failed to read buffered audio from disk, skipping a chunk: {e}")
+
+    def _start_refill(self) -> None:
+        # Restart the loop if it ever died, rather than leaving queued chunks unread
+        if self._refill_task is None or self._refill_task.done():
+            self._refill_task = asyncio.create_task(self._refill_loop())
 
     async def clear(self) -> None:
         """
@@ -127,43 +204,36 @@ class FrameStore:
         """
         
         async with self._read_lock:
-            if self._read_task:
-                self._read_task.cancel()
+            if self._refill_task:
+                self._refill_task.cancel()
 
                 try:
-                    await self._read_task
+                    await self._refill_task
                 except asyncio.CancelledError:
                     pass
+                except Exception as e:
+                    logger.error(f"Buffered audio refill failed: {e}")
 
-                self._read_task = None
+                self._refill_task = None
         
+        self._epoch += 1
+        self._not_full.set()
+
         self._event.clear()
+        self._low_water.clear()
         self._eos_written = False
         self._eos_emitted = False
+        self._failed = False
         self._refilling = False
-        self._file_index = 0
-        self._current_file_path = None
-        self._current_file = None
+        self._write_offset = 0
 
         self._chunk_frame_count = 0
         self._chunk_buffer.clear()
 
-        while not self._live_buffer.empty():
-            try:
-                self._live_buffer.get_nowait()
-            except asyncio.QueueEmpty:
-                break
+        self._live_buffer.clear()
 
         if self._connection._config.buffer.mode == BufferMode.DISK:
-            while self._disk_queue:
-                index = self._disk_queue.popleft()
-                path = f"wavecache/{self._connection._guild_id}/{index}.wcf"
-
-                try:
-                    if os.path.exists(path):
-                        os.remove(path)
-                except OSError:
-                    pass
+            self._disk_queue.clear()
             
             try:
                 for filename in os.listdir(f"wavecache/{self._connection._guild_id}"):
@@ -178,12 +248,14 @@ class FrameStore:
         """
         
         while True:
-            if not self._live_buffer.empty():
-                frame: bytes | bytes =  await self._live_buffer.get()
+            if self._live_buffer:
+                frame: bytes | None = self._live_buffer.popleft()
+
+                if self._capacity:
+                    self._not_full.set()
             
-                if self._connection._config.buffer.mode == BufferMode.DISK and self._live_buffer.qsize() <= self._low_mark and self._disk_queue:
-                    if self._read_task is None or self._read_task.done():
-                        self._read_task = asyncio.create_task(self._read_chunk())
+                if len(self._live_buffer) == self._low_mark:
+                    self._low_water.set()
                 
                 return frame
             
@@ -193,8 +265,17 @@ class FrameStore:
                 
                 return None
             
+            if self._disk_queue:
+                self._start_refill()
+                self._low_water.set()
+            
+            self._waiting = True
             self._event.clear()
-            await self._event.wait()
+
+            try:
+                await self._event.wait()
+            finally:
+                self._waiting = False
 
     async def store_frame(self, frame: bytes | None) -> None:
         """
@@ -207,44 +288,75 @@ class FrameStore:
         """
         
         if self._connection._config.buffer.mode == BufferMode.MEMORY:
-            await self._live_buffer.put(frame)
-            self._event.set()
+            epoch: int = self._epoch
+
+            while frame is not None and self._capacity and len(self._live_buffer) >= self._capacity:
+                self._not_full.clear()
+                await self._not_full.wait()
+
+                if self._epoch != epoch:
+                    return
+
+            self._live_buffer.append(frame)
+
+            if self._waiting:
+                self._event.set()
+
             return
         
         if frame is None:
-            self._eos_written = True
+            epoch: int = self._epoch
 
             async with self._chunk_lock:
                 await self._flush_chunk()
+            
+            if self._epoch != epoch:
+                return
 
-            if not self._disk_queue:
-                await self._live_buffer.put(None)
+            # Only mark the end once the last chunk is queued, or a refill could end playback early
+            self._eos_written = True
+
+            # A refill in flight appends the end itself, after the chunk it's reading
+            if not self._disk_queue and not self._refilling:
+                self._live_buffer.append(None)
     
-            self._event.set()
+            if self._waiting:
+                self._event.set()
+
             return
         
         has_backlog: bool = bool(self._disk_queue) or bool(self._chunk_buffer)
         
-        if not has_backlog and self._live_buffer.qsize() < self._high_mark:
-            await self._live_buffer.put(frame)
-            self._event.set()
+        if not has_backlog and len(self._live_buffer) < self._high_mark:
+            self._live_buffer.append(frame)
+
+            if self._waiting:
+                self._event.set()
+
             return
         
         async with self._chunk_lock:
-            self._chunk_buffer.extend(len(frame).to_bytes(2, "big") + frame)
+            self._chunk_buffer += _LENGTH_PREFIX.pack(len(frame))
+            self._chunk_buffer += frame
             self._chunk_frame_count += 1
 
             if self._chunk_frame_count >= self._chunk_frame_limit:
                 await self._flush_chunk()
-                self._event.set()
+                if self._waiting:
+                    self._event.set()
     
     async def wait(self) -> None:
         """
         Wait until the store is available to read from.
         """
         
-        if not self._live_buffer.empty() or (self._eos_written and not self._disk_queue):
+        if self._live_buffer or (self._eos_written and not self._disk_queue):
             return
         
+        self._waiting = True
         self._event.clear()
-        await self._event.wait()
\ No newline at end of file
+
+        try:
+            await self._event.wait()
+        finally:
+            self._waiting = False
\ No newline at end of file
@@ -164,6 +164,7 @@ class BufferConfig:
             The frame storage buffer mode - `DISK` is recommended for most devices, `MEMORY` is set by default as it's expected behavior (all audio stored in RAM).
         duration : int
             If `mode` is `BufferMode`.`DISK`, configures the amount of seconds of audio to be stored in each chunk file. `15-30` seconds is recommended, with lower values better for low-RAM and higher for high-RAM.
+            If `mode` is `BufferMode`.`MEMORY` and provided, caps the amount of seconds of audio buffered ahead of playback - Encoding pauses until playback frees room, so each playing guild holds an `FFmpeg` pool worker for the whole track and concurrent capped playbacks are limited to the pool size (`2` per CPU core, at most `16`) - Further playbacks wait for a worker to free up.
         
         Note
         ----
@@ -176,7 +177,7 @@ class BufferConfig:
             - If `duration` is provided and is not `int`.
         ValueError
             - If `mode` is `BufferMode`.`DISK` and `duration` is not provided.
-            - If `duration` is provided and is less than `1` while `mode` is `BufferMode.DISK`.
+            - If `duration` is provided and is less than `1`.
         """
 
         if not isinstance(mode, BufferMode):
@@ -191,7 +192,7 @@ class BufferConfig:
             error: str = "Duration must be provided when `BufferMode` is `DISK`"
             raise ValueError(error)
         
-        if duration and duration < 1 and mode == BufferMode.DISK:
+        if duration is not None and duration < 1:
             error: str = "Provided duration must be at least 1"
             raise ValueError(error)
 
@@ -200,7 +201,7 @@ class BufferConfig:
 
     @property
     def duration(self) -> int:
-        """If provided, the amount of seconds of audio each buffer cache file contains."""
+        """If provided, the amount of seconds of audio each buffer cache file contains, or the amount buffered ahead in `MEMORY` mode."""
         return self._duration
 
     @property
@@ -4,7 +4,7 @@ from enum import auto, IntEnum
 from hikariwave.audio.player import AudioPlayer
 from hikariwave.config import Config
 from hikariwave.event.types import WaveEventType
-from hikariwave.internal.encrypt import Encrypt
+from hikariwave.internal.encrypt import Cipher, Encrypt
 from hikariwave.networking.gateway import Opcode, ReadyPayload, SessionDescriptionPayload, VoiceGateway
 from hikariwave.networking.server import VoiceServer
 from typing import Callable, TYPE_CHECKING
@@ -36,7 +36,7 @@ class VoiceConnection:
 
     __slots__ = (
         "_client", "_guild_id", "_channel_id", "_endpoint", "_session_id", "_token", "_config",
-        "_server", "_gateway", "_ready", "_state", "_ssrc", "_mode", "_secret", "_player",
+        "_server", "_gateway", "_ready", "_state", "_ssrc", "_mode", "_cipher", "_session_generation", "_player",
     )
 
     def __init__(
@@ -90,8 +90,9 @@ class VoiceConnection:
         self._state: ConnectionStatus = ConnectionStatus.NEW
 
         self._ssrc: int = None
-        self._mode: Callable[[bytes, int, bytes, bytes], bytes] = None
-        self._secret: bytes = None
+        self._mode: Callable[[Cipher, int, bytes, bytes], bytes] = None
+        self._cipher: Cipher = None
+        self._session_generation: int = 0
 
         self._player: AudioPlayer = AudioPlayer(self)
     
@@ -184,7 +185,8 @@ class VoiceConnection:
 
     async def _gateway_session_description(self, payload: SessionDescriptionPayload) -> None:
         self._mode = getattr(Encrypt, payload.mode)
-        self._secret = payload.secret
+        self._cipher = Encrypt.create_cipher(payload.mode, payload.secret)
+        self._session_generation += 1
         self._state = ConnectionStatus.CONNECTED
 
         self._ready.set()
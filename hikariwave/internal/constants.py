@@ -20,10 +20,27 @@ class Audio:
     """FFmpeg blocksize."""
     FRAME_LENGTH: int = 20
     """Length of Opus frame in milliseconds."""
+    FRAME_LENGTH_NS: int = FRAME_LENGTH * 1_000_000
+    """Length of Opus frame in nanoseconds."""
+    PIPE_SIZE: int = 1024 * 1024
+    """Kernel buffer size requested for FFmpeg pipes, where the platform allows it."""
+    READ_SIZE: int = 256 * 1024
+    """Size of the buffer FFmpeg output is read into."""
     SAMPLING_RATE: int = 48000
     """Sampling rate."""
     SAMPLES_PER_FRAME: int = int(SAMPLING_RATE / 1000 * FRAME_LENGTH)
     """Amount of samples per Opus frame."""
+    FFMPEG_OUTPUT_ARGS: tuple[str, ...] = (
+        "-map", "0:a",
+        "-acodec", "libopus",
+        "-f", "opus",
+        "-ar", str(SAMPLING_RATE),
+        "-application", "audio",
+        "-frame_duration", str(FRAME_LENGTH),
+        "-loglevel", "warning",
+        "pipe:1",
+    )
+    """FFmpeg arguments that encode the selected audio stream into Ogg Opus on stdout."""
 
 class CloseCode(IntEnum):
     """Collection of a voice close event codes."""
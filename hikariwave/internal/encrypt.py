@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from hikariwave.internal.constants import Audio
+from typing import Callable
 
 import nacl.secret as secret
 import struct
 
+Cipher = AESGCM | secret.Aead
+
+_pack_nonce: Callable[[int], bytes] = struct.Struct(">I").pack
+_PAD_AES256_GCM: bytes = bytes(8)
+_PAD_XCHACHA20_POLY1305: bytes = bytes(20)
+
 __all__ = ("Encrypt",)
 
 class Encrypt:
@@ -15,14 +21,46 @@ class Encrypt:
     """A list of all currently supported, non-deprecated, complete, and tested encryption modes."""
 
     @staticmethod
-    def aead_aes256_gcm_rtpsize(secret_key: bytes, nonce: int, header: bytes, audio: bytes) -> bytes:
+    def create_cipher(mode: str, secret_key: bytes) -> Cipher:
         """
-        Encrypt audio using `aead_aes256_gcm_rtpsize`.
+        Create a reusable cipher for an encryption mode.
         
         Parameters
         ----------
+        mode : str
+            The name of the encryption mode.
         secret_key : bytes
-            32-byte AES encryption key provided by Discord.
+            32-byte encryption key provided by Discord.
+        
+        Returns
+        -------
+        Cipher
+            The cipher to pass to the mode's encryption method.
+        
+        Raises
+        ------
+        ValueError
+            If `mode` isn't a supported encryption mode.
+        """
+
+        if mode == "aead_aes256_gcm_rtpsize":
+            return AESGCM(secret_key)
+        
+        if mode == "aead_xchacha20_poly1305_rtpsize":
+            return secret.Aead(secret_key)
+        
+        error: str = f"Unsupported encryption mode: {mode}"
+        raise ValueError(error)
+
+    @staticmethod
+    def aead_aes256_gcm_rtpsize(cipher: AESGCM, nonce: int, header: bytes, audio: bytes) -> bytes:
+        """
+        Encrypt audio using `aead_aes256_gcm_rtpsize`.
+        
+        Parameters
+        ----------
+        cipher : AESGCM
+            Cipher created from the secret key provided by Discord.
         nonce : int
             32-bit packet counter.
         header : bytes
@@ -36,24 +74,20 @@ class Encrypt:
             The encrypted audio packet.
         """
 
-        aesgcm: AESGCM = AESGCM(secret_key)
-
-        packet_nonce: bytes = struct.pack(">I", nonce) + b"\x00" * 8
-        nonce = (nonce + 1) % Audio.BIT_32U
-        
-        encrypted: bytes = aesgcm.encrypt(packet_nonce, audio, header)
+        suffix: bytes = _pack_nonce(nonce)
+        encrypted: bytes = cipher.encrypt(suffix + _PAD_AES256_GCM, audio, header)
 
-        return header + encrypted + packet_nonce[8:]
+        return b"".join((header, encrypted, suffix))
 
     @staticmethod
-    def aead_xchacha20_poly1305_rtpsize(secret_key: bytes, nonce: int, header: bytes, audio: bytes) -> bytes:
+    def aead_xchacha20_poly1305_rtpsize(cipher: secret.Aead, nonce: int, header: bytes, audio: bytes) -> bytes:
         """
         Encrypt audio using `aead_xchacha20_poly1305_rtpsize`.
         
         Parameters
         ----------
-        secret_key : bytes
-            32-byte AES encryption key provided by Discord.
+        cipher : secret.Aead
+            Cipher created from the secret key provided by Discord.
         nonce : int
             32-bit packet counter.
         header : bytes
@@ -67,10 +101,7 @@ class Encrypt:
             The encrypted audio packet.
         """
         
-        box: secret.Aead = secret.Aead(secret_key)
-
-        packet_nonce: bytearray = bytearray(24)
-        packet_nonce[:4] = struct.pack(">I", nonce)
-        nonce = (nonce + 1) % Audio.BIT_32U
+        suffix: bytes = _pack_nonce(nonce)
+        encrypted: bytes = cipher.encrypt(audio, header, suffix + _PAD_XCHACHA20_POLY1305).ciphertext
 
-        return header + box.encrypt(audio, header, bytes(packet_nonce)).ciphertext + packet_nonce[:4]
\ No newline at end of file
+        return b"".join((header, encrypted, suffix))
\ No newline at end of file
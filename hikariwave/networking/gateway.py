@@ -14,6 +14,11 @@ import struct
 import time
 import websockets
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from hikariwave.connection import VoiceConnection
 
@@ -21,6 +26,15 @@ __all__ = ("VoiceGateway",)
 
 logger: logging.Logger = logging.getLogger("hikari-wave.gateway")
 
+if orjson is not None:
+    _decode_json: Callable[[str], Any] = orjson.loads
+    _encode_json: Callable[[Any], bytes | str] = orjson.dumps
+else:
+    _decode_json: Callable[[str], Any] = json.loads
+    _encode_json: Callable[[Any], bytes | str] = json.JSONEncoder(separators=(',', ':')).encode
+
+_HEARTBEAT: str = f'{{"op":{Opcode.HEARTBEAT:d},"d":{{"t":%d,"seq_ack":%d}}}}'
+
 class Payload:
     """Base payload implementation."""
 
@@ -117,13 +131,7 @@ class VoiceGateway:
         t: int = int(time.time())
         seq_ack: int = self._sequence
 
-        await self._send_packet({
-            "op": Opcode.HEARTBEAT,
-            'd': {
-                't': t,
-                "seq_ack": seq_ack,
-            }
-        })
+        await self._send_packet(_HEARTBEAT % (t, seq_ack))
         logger.debug(f"Heartbeat: T={t}, SeqAck={seq_ack}")
 
     async def _loop_heartbeat(self, interval: float) -> None:
@@ -229,7 +237,7 @@ class VoiceGateway:
             
             if isinstance(payload, str):
                 try:
-                    return json.loads(payload)
+                    return _decode_json(payload)
                 except json.JSONDecodeError as e:
                     await self.disconnect()
 
@@ -263,14 +271,19 @@ class VoiceGateway:
             }
         })
 
-    async def _send_packet(self, data: dict[str, Any] | tuple[int, bytes]) -> None:
+    async def _send_packet(self, data: dict[str, Any] | str | tuple[int, bytes]) -> None:
         try:
             if isinstance(data, tuple):
                 packet: bytes = bytes([data[0]]) + data[1]
                 await self._websocket.send(packet)
                 return
             
-            await self._websocket.send(json.dumps(data))
+            if isinstance(data, str):
+                await self._websocket.send(data)
+                return
+            
+            # `orjson` produces bytes, which must still go out as a text frame
+            await self._websocket.send(_encode_json(data), text=True)
         finally:
             return
         
@@ -261,4 +261,21 @@ class VoiceServer:
         if not self._udp or self._udp.is_closing():
             return
     
-        self._udp.sendto(data)
\ No newline at end of file
+        self._udp.sendto(data)
+
+    async def send_batch(self, packets: list[bytes]) -> None:
+        """
+        Send multiple UDP packets to Discord's voice server at once.
+        
+        Parameters
+        ----------
+        packets : list[bytes]
+            The UDP packets to send, in order.
+        """
+        
+        if not self._udp or self._udp.is_closing():
+            return
+        
+        sendto: Callable[[bytes], None] = self._udp.sendto
+        for packet in packets:
+            sendto(packet)
\ No newline at end of file
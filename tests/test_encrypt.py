@@ -0,0 +1,39 @@
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from hikariwave.internal.encrypt import Encrypt
+
+import nacl.secret as secret
+import pytest
+import struct
+
+KEY: bytes = bytes(range(32))
+HEADER: bytes = b"\x80\x78" + bytes(10)
+AUDIO: bytes = b"\xf8\xff\xfe" * 20
+
+@pytest.mark.parametrize("nonce", [0, 1, 0xFFFFFFFF])
+def test_aead_aes256_gcm_rtpsize(nonce: int):
+    cipher = Encrypt.create_cipher("aead_aes256_gcm_rtpsize", KEY)
+    packet: bytes = Encrypt.aead_aes256_gcm_rtpsize(cipher, nonce, HEADER, AUDIO)
+
+    assert packet[:12] == HEADER
+    assert packet[-4:] == struct.pack(">I", nonce)
+    assert AESGCM(KEY).decrypt(packet[-4:] + bytes(8), packet[12:-4], HEADER) == AUDIO
+
+@pytest.mark.parametrize("nonce", [0, 1, 0xFFFFFFFF])
+def test_aead_xchacha20_poly1305_rtpsize(nonce: int):
+    cipher = Encrypt.create_cipher("aead_xchacha20_poly1305_rtpsize", KEY)
+    packet: bytes = Encrypt.aead_xchacha20_poly1305_rtpsize(cipher, nonce, HEADER, AUDIO)
+
+    assert packet[:12] == HEADER
+    assert packet[-4:] == struct.pack(">I", nonce)
+    assert secret.Aead(KEY).decrypt(packet[12:-4], HEADER, packet[-4:] + bytes(20)) == AUDIO
+
+def test_nonces_differ_between_packets():
+    cipher = Encrypt.create_cipher("aead_aes256_gcm_rtpsize", KEY)
+    first: bytes = Encrypt.aead_aes256_gcm_rtpsize(cipher, 0, HEADER, AUDIO)
+    second: bytes = Encrypt.aead_aes256_gcm_rtpsize(cipher, 1, HEADER, AUDIO)
+
+    assert first[12:-4] != second[12:-4]
+
+def test_unsupported_mode():
+    with pytest.raises(ValueError):
+        Encrypt.create_cipher("xsalsa20_poly1305", KEY)
\ No newline at end of file
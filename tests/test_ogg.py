@@ -0,0 +1,111 @@
+from hikariwave.audio.ffmpeg import FFmpegPool, FFmpegWorker
+from hikariwave.audio.source import (
+    AudioSource,
+    BufferAudioSource,
+    FileAudioSource,
+)
+from hikariwave.audio.store import FrameStore
+from hikariwave.config import Config
+from pathlib import Path
+from types import SimpleNamespace
+
+import asyncio
+import os
+import pytest
+import struct
+import sys
+
+pytestmark = pytest.mark.skipif(os.name == "nt", reason="fake FFmpeg is a POSIX script")
+
+def _page(segments: list[int], body: bytes, *, continued: bool = False) -> bytes:
+    header: bytes = b"OggS" + struct.pack("<BBqIII", 0, 1 if continued else 0, 0, 1, 0, 0)
+    return header + bytes((len(segments),)) + bytes(segments) + body
+
+def _lacing(length: int) -> list[int]:
+    return [255] * (length // 255) + [length % 255]
+
+def _packet_page(*packets: bytes) -> bytes:
+    segments: list[int] = []
+    for packet in packets:
+        segments += _lacing(len(packet))
+    
+    return _page(segments, b"".join(packets))
+
+def _encode(
+    stream: bytes,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    source: AudioSource | None = None,
+) -> tuple[list[bytes], bool]:
+    (tmp_path / "stream.ogg").write_bytes(stream)
+
+    # Piped input is drained to a file first, the same way FFmpeg reads all of it
+    ffmpeg: Path = tmp_path / "ffmpeg"
+    ffmpeg.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        "if 'pipe:0' in sys.argv:\n"
+        f"    open({str(tmp_path / 'stdin.bin')!r}, 'wb').write(sys.stdin.buffer.read())\n"
+        f"sys.stdout.buffer.write(open({str(tmp_path / 'stream.ogg')!r}, 'rb').read())\n"
+    )
+    ffmpeg.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+    async def run() -> tuple[list[bytes], bool]:
+        connection = SimpleNamespace(_config=Config(), _guild_id=0)
+        store: FrameStore = FrameStore(connection)
+        connection.player = SimpleNamespace(_store=store)
+
+        await asyncio.wait_for(
+            FFmpegWorker(FFmpegPool()).encode(source or FileAudioSource("input.mp3"), connection),
+            timeout=10.0,
+        )
+
+        frames: list[bytes] = []
+        while (frame := await store.fetch_frame()) is not None:
+            frames.append(frame)
+
+        return frames, store._failed
+    
+    return asyncio.run(run())
+
+HEADERS: bytes = _packet_page(b"OpusHead" + bytes(11)) + _packet_page(b"OpusTags" + bytes(8))
+
+def test_skips_headers_and_splits_packets(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    packets: list[bytes] = [b"\x01" * 3, b"\x02" * 255, b"\x03" * 600, b"\x04" * 510]
+    stream: bytes = HEADERS + _packet_page(*packets[:2]) + _packet_page(*packets[2:])
+
+    assert _encode(stream, tmp_path, monkeypatch) == (packets, False)
+
+def test_packet_continued_across_pages(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    spanning: bytes = bytes(range(256)) * 3
+    stream: bytes = (
+        HEADERS +
+        _page([5, 255, 255], b"\x01" * 5 + spanning[:510]) +
+        _page([255], spanning[510:765], continued=True) +
+        _page([3, 7], spanning[765:] + b"\x02" * 7, continued=True)
+    )
+
+    assert _encode(stream, tmp_path, monkeypatch) == ([b"\x01" * 5, spanning, b"\x02" * 7], False)
+
+def test_many_pages_larger_than_one_read(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    packets: list[bytes] = [bytes((i % 256,)) * 400 for i in range(2000)]
+    stream: bytes = HEADERS + b"".join(_packet_page(*packets[i:i + 10]) for i in range(0, len(packets), 10))
+
+    assert _encode(stream, tmp_path, monkeypatch) == (packets, False)
+
+def test_buffer_source_is_fed_through_stdin(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    packets: list[bytes] = [b"\x01" * 120, b"\x02" * 300]
+    content: bytearray = bytearray(range(256)) * 1024
+    stream: bytes = HEADERS + _packet_page(*packets)
+
+    assert _encode(stream, tmp_path, monkeypatch, BufferAudioSource(content)) == (packets, False)
+    assert (tmp_path / "stdin.bin").read_bytes() == content
+
+def test_invalid_output_fails_the_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    assert _encode(b"not an ogg stream at all" * 4, tmp_path, monkeypatch) == ([], True)
+
+def test_invalid_output_after_audio_keeps_the_source(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    stream: bytes = HEADERS + _packet_page(b"\x01" * 10) + b"garbage" * 8
+
+    assert _encode(stream, tmp_path, monkeypatch) == ([b"\x01" * 10], False)
\ No newline at end of file
@@ -0,0 +1,98 @@
+from collections import deque
+from hikariwave.audio.source import (
+    AudioSource,
+    BufferAudioSource,
+    FileAudioSource,
+    URLAudioSource,
+)
+
+import pytest
+
+@pytest.mark.parametrize(
+    "buffer",
+    [b"\x00" * 4096, bytearray(4096), memoryview(bytes(4096))],
+)
+def test_buffer_repr_summarizes_content(buffer: object):
+    source = BufferAudioSource(buffer, name="clip")
+
+    assert repr(source) == (
+        "BufferAudioSource(content=<4096 bytes>, bitrate=None, channels=None, name='clip', volume=None)"
+    )
+
+def test_file_repr():
+    source = FileAudioSource("song.mp3", bitrate="128k")
+
+    assert repr(source) == (
+        "FileAudioSource(content='song.mp3', bitrate='128k', channels=None, name=None, volume=None)"
+    )
+
+def test_url_repr_omits_hash():
+    assert "hash" not in repr(URLAudioSource("https://example.com/song.mp3"))
+
+@pytest.mark.parametrize(
+    "buffer",
+    [b"\x00" * 4096, bytearray(4096), memoryview(bytearray(4096))],
+)
+def test_buffer_hash_mutable_buffers(buffer: object):
+    source = BufferAudioSource(buffer)
+
+    assert hash(source) == hash(BufferAudioSource(bytes(4096)))
+    assert source in {source}
+
+def test_buffer_hash_depends_on_length():
+    assert hash(BufferAudioSource(bytes(10))) != hash(BufferAudioSource(bytes(11)))
+
+def test_buffer_equality():
+    assert BufferAudioSource(b"abc") == BufferAudioSource(bytearray(b"abc"))
+    assert BufferAudioSource(b"abc") != BufferAudioSource(b"abd")
+    assert BufferAudioSource(b"abc") != BufferAudioSource(b"abcd")
+
+@pytest.mark.parametrize("cls", [FileAudioSource, URLAudioSource])
+def test_content_hash_and_equality(cls: type):
+    first = cls("a.mp3")
+
+    assert hash(first) == hash(cls("a.mp3"))
+    assert first == cls("a.mp3", name="other")
+    assert first != cls("b.mp3")
+    assert len({first, cls("a.mp3"), cls("b.mp3")}) == 2
+
+def test_equality_requires_same_type():
+    assert FileAudioSource("a.mp3") != URLAudioSource("a.mp3")
+    assert hash(FileAudioSource("a.mp3")) != hash(URLAudioSource("a.mp3"))
+
+class _CustomSource(AudioSource):
+    __slots__ = ("_content",)
+
+    def __init__(self, content: str) -> None:
+        self._content = content
+
+def test_custom_subclass_hash_and_equality():
+    first = _CustomSource("a")
+
+    assert hash(first) == hash(_CustomSource("a"))
+    assert first == _CustomSource("a")
+    assert first != _CustomSource("b")
+
+    queue: deque[AudioSource] = deque((_CustomSource("b"), first))
+    queue.remove(_CustomSource("a"))
+    assert list(queue) == [_CustomSource("b")]
+
+def test_repr_of_subclass_without_slots():
+    class Subclass(FileAudioSource):
+        pass
+
+    assert repr(Subclass("a.mp3")) == (
+        "Subclass(content='a.mp3', bitrate=None, channels=None, name=None, volume=None)"
+    )
+
+def test_repr_with_string_slots_and_exclusions():
+    class Tagged(_CustomSource):
+        __slots__ = "_tag"
+        _repr_exclude = ("_content",)
+
+        def __init__(self, content: str) -> None:
+            super().__init__(content)
+            self._tag = "x"
+
+    assert repr(Tagged("a")) == "Tagged(tag='x')"
+    assert repr(_CustomSource("a")) == "_CustomSource(content='a')"
\ No newline at end of file
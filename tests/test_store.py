@@ -0,0 +1,206 @@
+from hikariwave.audio import store as store_module
+from hikariwave.audio.store import FrameStore
+from hikariwave.config import BufferConfig, BufferMode, Config
+from pathlib import Path
+from types import SimpleNamespace
+
+import asyncio
+import os
+import pytest
+import random
+import time
+
+def _store(mode: BufferMode, duration: int | None = None) -> FrameStore:
+    connection = SimpleNamespace(_config=Config(buffer=BufferConfig(mode, duration=duration)), _guild_id=0)
+    store: FrameStore = FrameStore(connection)
+    connection.player = SimpleNamespace(_store=store)
+
+    return store
+
+def _frames(count: int, seed: int = 0) -> list[bytes]:
+    rng: random.Random = random.Random(seed)
+    return [bytes((i % 256,)) * rng.randint(1, 1275) for i in range(count)]
+
+async def _drain(store: FrameStore) -> list[bytes]:
+    frames: list[bytes] = []
+    while (frame := await asyncio.wait_for(store.fetch_frame(), timeout=5.0)) is not None:
+        frames.append(frame)
+    
+    return frames
+
+async def _produce(store: FrameStore, frames: list[bytes]) -> None:
+    # Stops once the store is cleared, the same way an encode does
+    epoch: int = store._epoch
+
+    for frame in frames:
+        if store._epoch != epoch:
+            return
+
+        await store.store_frame(frame)
+    
+    if store._epoch == epoch:
+        await store.store_frame(None)
+
+@pytest.fixture(autouse=True)
+def _cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.chdir(tmp_path)
+
+def test_disk_round_trip_while_playing():
+    frames: list[bytes] = _frames(3000)
+
+    async def run() -> list[bytes]:
+        store: FrameStore = _store(BufferMode.DISK, 1)
+        producer: asyncio.Task[None] = asyncio.create_task(_produce(store, frames))
+        result: list[bytes] = await _drain(store)
+        await producer
+
+        return result
+    
+    assert asyncio.run(run()) == frames
+
+def test_disk_spills_to_a_single_file_and_refills():
+    frames: list[bytes] = _frames(3000)
+
+    async def run() -> list[bytes]:
+        store: FrameStore = _store(BufferMode.DISK, 1)
+        await _produce(store, frames)
+
+        # Everything past the live buffer is appended to one cache file
+        assert os.listdir("wavecache/0") == ["0.wcf"]
+        assert len(store._live_buffer) == store._high_mark
+        assert len(store._disk_queue) > 1
+
+        result: list[bytes] = await _drain(store)
+        
+        assert not store._disk_queue
+        assert os.listdir("wavecache/0") == []
+        return result
+    
+    assert asyncio.run(run()) == frames
+
+def test_refill_starts_at_low_water():
+    async def run() -> None:
+        store: FrameStore = _store(BufferMode.DISK, 1)
+        await _produce(store, _frames(500))
+        queued: int = len(store._disk_queue)
+
+        while len(store._live_buffer) > store._low_mark + 1:
+            await store.fetch_frame()
+        
+        await asyncio.sleep(0.05)
+        assert len(store._disk_queue) == queued
+
+        await store.fetch_frame()
+        for _ in range(100):
+            if len(store._disk_queue) < queued:
+                break
+
+            await asyncio.sleep(0.01)
+        
+        assert len(store._disk_queue) == queued - 1
+    
+    asyncio.run(run())
+
+@pytest.mark.parametrize("mode,duration", [(BufferMode.MEMORY, None), (BufferMode.DISK, 1)])
+def test_parked_consumer_is_woken(mode: BufferMode, duration: int | None):
+    async def run() -> None:
+        store: FrameStore = _store(mode, duration)
+        waiter: asyncio.Task[None] = asyncio.create_task(store.wait())
+        fetcher: asyncio.Task[bytes | None] = asyncio.create_task(store.fetch_frame())
+        await asyncio.sleep(0.01)
+
+        assert store._waiting
+        await store.store_frame(b"\x01")
+
+        assert await asyncio.wait_for(fetcher, timeout=1.0) == b"\x01"
+        await asyncio.wait_for(waiter, timeout=1.0)
+        assert not store._waiting
+
+        fetcher = asyncio.create_task(store.fetch_frame())
+        await asyncio.sleep(0.01)
+        await store.store_frame(None)
+
+        assert await asyncio.wait_for(fetcher, timeout=1.0) is None
+    
+    asyncio.run(run())
+
+def test_clear_during_read(monkeypatch: pytest.MonkeyPatch):
+    read_file = store_module._read_file
+
+    def slow_read(path: str, offset: int, length: int) -> bytes:
+        time.sleep(0.02)
+        return read_file(path, offset, length)
+    
+    monkeypatch.setattr(store_module, "_read_file", slow_read)
+
+    async def run() -> list[bytes]:
+        store: FrameStore = _store(BufferMode.DISK, 1)
+        await _produce(store, _frames(1000, seed=1))
+
+        while not store._refilling:
+            await store.fetch_frame()
+        
+        await store.clear()
+
+        frames: list[bytes] = _frames(300, seed=2)
+        producer: asyncio.Task[None] = asyncio.create_task(_produce(store, frames))
+        result: list[bytes] = await _drain(store)
+        await producer
+
+        assert result == frames
+    
+    asyncio.run(run())
+
+def test_clear_during_flush(monkeypatch: pytest.MonkeyPatch):
+    write_file = store_module._write_file
+
+    def slow_write(path: str, offset: int, chunk: bytearray) -> None:
+        time.sleep(0.05)
+        write_file(path, offset, chunk)
+    
+    monkeypatch.setattr(store_module, "_write_file", slow_write)
+
+    async def run() -> None:
+        store: FrameStore = _store(BufferMode.DISK, 1)
+        producer: asyncio.Task[None] = asyncio.create_task(_produce(store, _frames(1000, seed=1)))
+
+        while not store._disk_queue:
+            await asyncio.sleep(0.01)
+        
+        await store.clear()
+        await producer
+
+        frames: list[bytes] = _frames(300, seed=2)
+        producer = asyncio.create_task(_produce(store, frames))
+        result: list[bytes] = await _drain(store)
+        await producer
+
+        assert result == frames
+        assert os.listdir("wavecache/0") == []
+    
+    asyncio.run(run())
+
+def test_read_error_skips_chunk(monkeypatch: pytest.MonkeyPatch):
+    read_file = store_module._read_file
+    calls: list[int] = []
+
+    def failing_read(path: str, offset: int, length: int) -> bytes:
+        calls.append(offset)
+        if len(calls) == 1:
+            raise OSError("disk unavailable")
+        
+        return read_file(path, offset, length)
+    
+    monkeypatch.setattr(store_module, "_read_file", failing_read)
+
+    async def run() -> list[bytes]:
+        store: FrameStore = _store(BufferMode.DISK, 1)
+        await _produce(store, _frames(500))
+
+        return await _drain(store)
+    
+    frames: list[bytes] = _frames(500)
+    result: list[bytes] = asyncio.run(run())
+
+    # The first 50 frames stay live, and the first chunk of 50 after them is lost
+    assert result == frames[:50] + frames[100:]
\ No newline at end of file
@@ -1,4 +1,6 @@
 from hikariwave.config import (
+    BufferConfig,
+    BufferMode,
     validate_bitrate,
     validate_channels,
     validate_volume,
@@ -67,4 +69,25 @@ def test_valid_volumes(input_value: float | int | str, expected: float | str):
 )
 def test_invalid_volumes(input_value: object):
     with pytest.raises((ValueError, TypeError)):
-        validate_volume(input_value)
\ No newline at end of file
+        validate_volume(input_value)
+
+@pytest.mark.parametrize(
+    "mode,duration",
+    [(BufferMode.MEMORY, None), (BufferMode.MEMORY, 1), (BufferMode.DISK, 15)],
+)
+def test_valid_buffer_configs(mode: BufferMode, duration: int | None):
+    assert BufferConfig(mode, duration=duration).duration == duration
+
+@pytest.mark.parametrize(
+    "mode,duration",
+    [
+        (BufferMode.MEMORY, 0),
+        (BufferMode.MEMORY, -5),
+        (BufferMode.DISK, None),
+        (BufferMode.DISK, 0),
+        (BufferMode.MEMORY, "10"),
+    ],
+)
+def test_invalid_buffer_configs(mode: BufferMode, duration: object):
+    with pytest.raises((ValueError, TypeError)):
+        BufferConfig(mode, duration=duration)
\ No newline at end of file